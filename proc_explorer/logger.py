@@ -1,3 +1,10 @@
+from collections import deque
+
+DEBUG = False
+"""Set to True to capture debug logging. Off by default - the hot paths
+(key/mouse events, refresh loops) log very aggressively."""
+
+
 class Logger:
     # NOTE: `textual` actually ships it's own logger for the exact reason this logger was created
     # TODO: Migrate to `textual`'s logger
@@ -6,21 +13,35 @@ class Logger:
 
     This exists because during the UI loop, sys.stdout appears to be overridden
     effectively blocking any print statements from being printed to the console while the UI's event loop is running
+
+    Messages are kept in a bounded ring buffer so logging on the UI hot path
+    (every key press, mouse move, refresh iteration, ...) cannot grow memory
+    unbounded over the app's lifetime. Once full, the oldest messages are dropped.
     """
 
+    MAX_MSGS = 4096
+    """maximum number of messages to keep. Oldest messages are dropped first."""
+
     def __init__(self):
-        self.msgs = []
+        self.msgs = deque(maxlen=self.MAX_MSGS)
+        self.enabled = DEBUG
+        """Flag to indicate if logging is enabled. Callers on hot paths should
+        check this themselves before building an f-string, so the string is
+        never interpolated when logging is off."""
 
     def log(self, s):
         """logs a message to be printed later"""
-        s = str(s)
+        if not self.enabled:
+            return
+        # NOTE: intentionally no str() here - most logged values are never printed,
+        # so stringifying is deferred to print()
         self.msgs.append(s)
 
     def print(self):
         """prints all the logged messages"""
         for msg in self.msgs:
-            print(msg)
-        self.msgs = []
+            print(str(msg))
+        self.msgs.clear()
 
 
 logger = Logger()
@@ -4,8 +4,16 @@ from textual.containers import Container
 from textual import events
 from textual.app import App, ComposeResult
 
+import asyncio
+
 from proc_explorer.logger import logger
-from proc_explorer.util import get_terminal_size
+from proc_explorer.util import (
+    ProcessListChanged,
+    RefreshBus,
+    SelectionChanged,
+    get_terminal_size,
+    shared_process,
+)
 
 
 from proc_explorer.widgets.process_list import ProcessesListWidget
@@ -16,6 +24,8 @@ class ProcExplorerApp(App):
     TITLE = "Process Explorer"
     CSS_PATH = "proc_explorer.tcss"
     CLOSE_TIMEOUT = 3.0
+    RERENDER_DELAY = 10.0
+    """seconds between ProcessListChanged events on the refresh bus"""
 
     BINDINGS = [
         Binding(key="t", action="toggle_widget", description="toggle widget focus"),
@@ -24,11 +34,10 @@ class ProcExplorerApp(App):
     ]
 
     def __init__(self, *args, **kwargs) -> None:
-        default_kwargs = {
-            "watch_css": True,
-        }
-        kwargs = {**default_kwargs, **kwargs}  # merge default kwargs, prioritize kwargs
+        kwargs.setdefault("watch_css", True)  # caller-provided kwargs win
         super().__init__(*args, **kwargs)
+        self.refresh_bus = RefreshBus()
+        """fan-out bus the widgets consume their refresh events from"""
         logger.log("App initialized!")
 
     @property
@@ -38,7 +47,8 @@ class ProcExplorerApp(App):
     @property
     def should_render_in_landscape_mode(self) -> bool:
         lines, columns = get_terminal_size()
-        logger.log(f"terminal lines: {lines},  columns: {columns}")
+        if logger.enabled:
+            logger.log(f"terminal lines: {lines},  columns: {columns}")
         return (columns // 3) > lines
 
     def _set_portrait_mode(self) -> None:
@@ -65,9 +75,10 @@ class ProcExplorerApp(App):
 
     async def on_resize(self, event: events.Resize) -> None:
         logger.log(event)
+        # the widgets rebuild their own columns from their resize events,
+        # so the app only has to pick the orientation
         if self.should_render_in_landscape_mode:
             self._set_landscape_mode()
-            await self._processes_widget._refresh_columns()
         else:
             self._set_portrait_mode()
 
@@ -76,6 +87,18 @@ class ProcExplorerApp(App):
             self._set_landscape_mode()
         else:
             self._set_portrait_mode()
+        shared_process.subscribe(self._on_selection_changed)
+        self.run_worker(self._refresh_bus_loop, group="refresh_bus", name="refresh_bus")
+
+    def _on_selection_changed(self, pid: int | None) -> None:
+        """Relay selection changes from shared_process onto the refresh bus"""
+        self.refresh_bus.post(SelectionChanged(pid))
+
+    async def _refresh_bus_loop(self) -> None:
+        """The single periodic producer driving widget refreshes"""
+        while self._running:
+            self.refresh_bus.post(ProcessListChanged())
+            await asyncio.sleep(self.RERENDER_DELAY)
 
     def compose(self) -> ComposeResult:
         self._header = Header(classes="header")
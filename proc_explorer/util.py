@@ -1,3 +1,7 @@
+import asyncio
+import time
+from shutil import get_terminal_size as _get_terminal_size
+
 import psutil
 
 
@@ -9,24 +13,86 @@ class SharedProcess:
     _instance = None
 
     def __init__(self):
-        self.pid = None
+        self._pid = None
+        self._subscribers = []
+        self._cached_proc: psutil.Process | None = None
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(SharedProcess, cls).__new__(cls)
         return cls._instance
 
+    @property
+    def pid(self) -> int | None:
+        return self._pid
+
+    @pid.setter
+    def pid(self, value) -> None:
+        # coerce once at assignment so reads don't have to
+        if isinstance(value, str):
+            value = int(value)
+        self._pid = value
+        for callback in self._subscribers:
+            callback(value)
+
+    def subscribe(self, callback) -> None:
+        """Register a callback invoked with the new pid whenever it is assigned
+
+        This lets widgets react to selection changes instead of polling for them
+        """
+        self._subscribers.append(callback)
+
     @property
     def proc(self) -> psutil.Process | None:
-        if isinstance(self.pid, str):
-            self.pid = int(self.pid)
-        if isinstance(self.pid, int):
-            return psutil.Process(pid=self.pid)
+        if self._pid is None:
+            return None
+        # constructing a psutil.Process validates the PID against /proc, so
+        # reuse the previous object while it still points at a live process
+        cached = self._cached_proc
+        if cached is not None and cached.pid == self._pid and cached.is_running():
+            return cached
+        self._cached_proc = psutil.Process(pid=self._pid)
+        return self._cached_proc
 
 
 shared_process = SharedProcess()
 
 
+class ProcessListChanged:
+    """Refresh bus event: the process table should re-scan"""
+
+
+class SelectionChanged:
+    """Refresh bus event: the selected process changed"""
+
+    def __init__(self, pid: int | None):
+        self.pid = pid
+
+
+class RefreshBus:
+    """
+    Single-producer fan-out for refresh events
+
+    The app posts events from one background worker; each widget subscribes
+    and receives them on its own queue. With N widgets this means one periodic
+    wakeup total instead of N independent polling loops.
+    """
+
+    def __init__(self):
+        self._queues: list[asyncio.Queue] = []
+
+    def subscribe(self) -> asyncio.Queue:
+        """Returns a fresh queue that will receive every event posted from now on"""
+        queue = asyncio.Queue()
+        self._queues.append(queue)
+        return queue
+
+    def post(self, event) -> None:
+        """Deliver an event to every subscriber"""
+        for queue in self._queues:
+            queue.put_nowait(event)
+
+
 class UndefinedType:
     """
     This is designed to mimic the `None` type as closely as possible
@@ -34,15 +100,16 @@ class UndefinedType:
     we want `Undefined is None` to return False
 
     This is useful when we want to differentiate between a value that is `None` and a value that was never set
+
+    It's a singleton, so check for it with `x is Undefined` - the same way you
+    would check for None. No custom __eq__ needed; identity is the contract.
     """
 
     _instance = None
-    _memory_address = 0
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(UndefinedType, cls).__new__(cls)
-            cls._memory_address = id(cls._instance)
         return cls._instance
 
     def __str__(self):
@@ -54,31 +121,34 @@ class UndefinedType:
     def __bool__(self):
         return False
 
-    def __hash__(self):
-        return hash(self._memory_address)
 
-    def __eq__(self, other):
-        return (
-            hasattr(other, "_memory_address")
-            and self._memory_address == other._memory_address
-        )
+Undefined = UndefinedType()
 
 
-Undefined = UndefinedType()
+_SIZE_CACHE_TTL = 0.1
+"""seconds to reuse a cached terminal size before querying the tty again"""
+_size_cache: tuple[int, int] | None = None
+_size_cache_timestamp = 0.0
 
 
 def get_terminal_size() -> tuple[int, int]:
-    try:
-        from shutil import get_terminal_size as _get_terminal_size
-
-        columns, lines = _get_terminal_size()
-    except ImportError:
-        try:
-            from subprocess import check_output
+    """Returns the terminal size as (lines, columns)
 
-            lines, columns = tuple(map(int, check_output(["stty", "size"]).split()))
-        except Exception:
-            print("Error getting screen size...")
-            return 80, 24
+    The size is cached for a short TTL - the widgets query it several times
+    per refresh/resize and each uncached query is an ioctl against the tty
+    """
+    global _size_cache, _size_cache_timestamp
+    now = time.monotonic()
+    if _size_cache is not None and now - _size_cache_timestamp < _SIZE_CACHE_TTL:
+        return _size_cache
 
-    return lines, columns
+    try:
+        columns, lines = _get_terminal_size()
+    except OSError:
+        # shutil already falls back to the COLUMNS/LINES env vars and a sane
+        # default, so there's no tty to interrogate if we get here
+        return 24, 80
+
+    _size_cache = (lines, columns)
+    _size_cache_timestamp = now
+    return _size_cache
@@ -1,8 +1,14 @@
+import ctypes
+import errno
 import os
+import platform
+import sys
+import time
+
 import psutil
 from textual.widgets import DataTable
 
-from proc_explorer.util import Undefined, get_terminal_size
+from proc_explorer.util import SelectionChanged, Undefined
 
 import asyncio
 from rich.text import Text
@@ -11,6 +17,58 @@ from proc_explorer.logger import logger
 from proc_explorer.util import shared_process
 
 
+# statx(2) plumbing. We only ever want st_size, and statx lets us ask for just
+# that (STATX_SIZE) without forcing the filesystem to sync attributes
+# (AT_STATX_DONT_SYNC) - much cheaper than a full os.stat on networked/lazy
+# filesystems. Falls back to os.stat wherever statx isn't available.
+_AT_FDCWD = -100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_SIZE = 0x200
+_STATX_BUF_LEN = 256
+_STX_SIZE_OFFSET = 40
+"""byte offset of the u64 stx_size field within struct statx"""
+
+_SYS_statx = {"x86_64": 332, "aarch64": 291}.get(platform.machine())
+_statx_syscall = None
+if sys.platform.startswith("linux") and _SYS_statx is not None:
+    try:
+        _statx_syscall = ctypes.CDLL(None, use_errno=True).syscall
+    except (OSError, AttributeError):
+        _statx_syscall = None
+_statx_ok = _statx_syscall is not None
+"""set False permanently the first time the kernel reports statx unsupported"""
+
+
+def _file_size(path: str) -> int:
+    """Returns the size of the file at path in bytes
+
+    Uses a raw statx(STATX_SIZE | AT_STATX_DONT_SYNC) syscall on Linux so only
+    the size is fetched, falling back to os.stat elsewhere (or if the kernel
+    rejects statx). Raises OSError like os.stat does
+    """
+    global _statx_ok
+    if _statx_ok:
+        buf = ctypes.create_string_buffer(_STATX_BUF_LEN)
+        ret = _statx_syscall(
+            _SYS_statx,
+            _AT_FDCWD,
+            os.fsencode(path),
+            _AT_STATX_DONT_SYNC,
+            _STATX_SIZE,
+            buf,
+        )
+        if ret == 0:
+            return int.from_bytes(
+                buf.raw[_STX_SIZE_OFFSET : _STX_SIZE_OFFSET + 8], "little"
+            )
+        err = ctypes.get_errno()
+        if err in (errno.ENOSYS, errno.EINVAL):
+            _statx_ok = False  # old kernel/libc - stop trying
+        else:
+            raise OSError(err, os.strerror(err), path)
+    return os.stat(path).st_size
+
+
 class File:
     """
     A definition of a file object for the purposes of this widget
@@ -19,40 +77,38 @@ class File:
     def __init__(self, path: str, fd: int):
         self.path = path  # file path
         self.fd = fd  # file descriptor
-
-    @property
-    def _filesize(self) -> int:
-        """Returns the size of the file in bytes"""
-        return os.stat(self.path).st_size
-
-    @property
-    def filesize(self) -> str:
-        """Returns the size of the file in human readable format"""
-        return psutil._common.bytes2human(self._filesize)
+        # stat once up front - filesize used to re-stat on every access,
+        # which turned each render into a fresh syscall per file
+        try:
+            self._size = _file_size(self.path)
+        except OSError:  # file vanished or is unreadable
+            self._size = 0
+        self.filesize = psutil._common.bytes2human(self._size)
+        """the size of the file in human readable format, formatted once here"""
 
 
 class OpenFilesListWidget(DataTable):
+    _SPACE_TRANS = str.maketrans({" ": "_"})
+    """translate table mapping spaces to underscores for path rendering"""
+
     def __init__(self, *args, **kwargs):
-        default_kwargs = {
-            "show_header": True,
-            "cursor_type": "row",
-        }
-        """default kwargs for the widget. These will be merged **kwargs. **kwargs overrides default_kwargs if there is a conflict."""
-        kwargs = {**default_kwargs, **kwargs}
+        # default kwargs for the widget. Caller-provided **kwargs win on conflict.
+        kwargs.setdefault("show_header", True)
+        kwargs.setdefault("cursor_type", "row")
         super().__init__(*args, **kwargs)
 
-        self.__lock = asyncio.Lock()
-        """async friendly lock to prevent deadlocks and concurrency issues"""
-
-        self.__POLLING_INTERVAL = 0.50
-        """seconds to wait between all polling. Primarily used by UI refresh loop"""
-        self.__lock = asyncio.Lock()
-        """async friendly lock to prevent deadlocks and concurrency issues"""
-        self.__last_terminal_size = get_terminal_size()
-        """Terminal screen size"""
+        self._refreshing = False
+        """Flag set while a refresh is in flight. Only one task ever refreshes,
+        so a plain bool is enough - no lock, no extra await suspension points"""
+        self._columns_stale = True
+        """True when the columns need (re)building - set by resize events"""
         self.loading = True
         """Flag to indicate if the widget is loading. Widget renders a loader when this is True"""
         self.last_pid = Undefined  # None prevents initial render/logic
+        self.__FILES_CACHE_TTL = 1.0
+        """seconds a collected file list stays valid for the same pid"""
+        self._files_cache: tuple[int, float, list[File]] | None = None
+        """(pid, collected_at, files) of the last collection, reused within the TTL"""
 
     @property
     def target_proc(self) -> psutil.Process | None:
@@ -67,23 +123,41 @@ class OpenFilesListWidget(DataTable):
 
     @property
     def open_files(self) -> list[File]:
+        return self._collect_files()
+
+    def _collect_files(self) -> list[File]:
+        """Returns a File for every file the target process has open
+
+        Synchronous on purpose - walking /proc/<pid>/fd is the syscall-heavy
+        half of the refresh and is run in a thread via asyncio.to_thread()
+        """
         # TODO: rely on `lsof` instead if it exists
         # psutil is not able to retrieve as much information
-        files = []
+        files: list[File] = []
         proc = self.target_proc
         if proc is None:
             logger.log("OpenFilesListWidget target_proc is None")
             return files
+        cache = self._files_cache
+        if (
+            cache is not None
+            and cache[0] == proc.pid
+            and time.monotonic() - cache[1] < self.__FILES_CACHE_TTL
+        ):
+            # same process, collected a moment ago - skip the /proc/<pid>/fd
+            # walk and the per-file stats entirely
+            return cache[2]
         try:
-            logger.log(f"proc is : {proc}")
+            if logger.enabled:
+                logger.log(f"proc is : {proc}")
             for popenfile in proc.open_files():
                 file = File(popenfile.path, popenfile.fd)
                 files.append(file)
-            logger.log(f"OpenFilesListWidget grabbed the files!!!")
         except psutil.AccessDenied:
             pass
         except psutil.NoSuchProcess:
             pass
+        self._files_cache = (proc.pid, time.monotonic(), files)
         return files
 
     def on_mount(self) -> None:
@@ -95,112 +169,111 @@ class OpenFilesListWidget(DataTable):
 
         the widget is mounted when it is added to the DOM of the app
         """
+        # runs on the app's event loop - the syscall-heavy collection is pushed
+        # to a thread by the refresh itself via asyncio.to_thread
         self.run_worker(
             self._refresh_loop,
             group="open_files",
             name="open_files",
-            thread=True,
             start=True,
         )
         logger.log("OpenFilesListWidget mounted!")
 
-    @property
-    def has_size_changed(self) -> bool:
-        """Check if the terminal size has changed"""
-        lines, columns = get_terminal_size()
-        return not self.__last_terminal_size == (lines, columns)
+    async def on_resize(self, event) -> None:
+        """Resize event handler for the widget
+
+        textual delivers the new size with the event, so there's nothing to
+        poll - just mark the columns stale and rebuild them
+        """
+        self._columns_stale = True
+        if self._refreshing:
+            return
+        await self._refresh_columns()
+        if self.last_pid is not Undefined:
+            # rebuilding columns wiped the rows - repopulate for the
+            # currently selected process
+            await self._refresh()
 
     async def _refresh_loop(self) -> None:
+        """main event loop for refreshing the widgets UI in the background
+
+        No polling - the loop sleeps until a SelectionChanged event arrives on
+        the app's refresh bus, then refreshes if the pid actually changed
+        """
         logger.log("OpenFilesListWidget refresh loop started!")
+        queue = self.app.refresh_bus.subscribe()  # pyright: ignore
         while self.app._running:
-            target_proc = self.target_proc
-            target_pid = getattr(target_proc, "pid", None)
-
-            logger.log("OpenFilesListWidget refresh loop running")
-            if self.__lock.locked():
-                logger.log("OpenFilesListWidget refresh loop is locked")
-                await asyncio.sleep(self.__POLLING_INTERVAL)
+            event = await queue.get()
+            if not isinstance(event, SelectionChanged):
                 continue
 
-            if target_proc and target_proc.pid == self.last_pid:
-                logger.log("OpenFilesListWidget target_proc is the same as last_proc")
-                await asyncio.sleep(self.__POLLING_INTERVAL)
+            target_pid = event.pid
+            if target_pid is None or target_pid == self.last_pid:
                 continue
 
-            if self.has_pid_changed:
+            if logger.enabled:
                 logger.log(
-                    f"OpenFilesListWidget pid has changed! last_pid: {self.last_pid}, target_proc.pid: {target_pid}"
+                    f"OpenFilesListWidget pid has changed! last_pid: {self.last_pid}, target_pid: {target_pid}"
                 )
-                await self._refresh()
+            await self._refresh()
+            self.last_pid = target_pid
 
-            await asyncio.sleep(self.__POLLING_INTERVAL)
-
-            self.last_pid = target_pid or self.last_pid
-
-    async def _refresh(self, with_lock=True) -> None:
+    async def _refresh(self) -> None:
         logger.log("OpenFilesListWidget refreshing!")
-        self.loading = True
-        self.clear()
-        await self._refresh_columns(with_lock=with_lock)
-        await self._refresh_rows(with_lock=with_lock)
-        self.loading = False
+        if self._refreshing:
+            return
+        self._refreshing = True
+        try:
+            self.loading = True
+            self.clear()  # rows only - columns are rebuilt from resize events
+            await self._refresh_rows()
+            self.loading = False
+        finally:
+            self._refreshing = False
         logger.log("OpenFilesListWidget refreshed!")
 
-    async def _refresh_rows(self, with_lock=True) -> None:
+    async def _refresh_rows(self) -> None:
         """Refresh the rows of the widget"""
-        if with_lock:
-            async with self.__lock:
-                await self.__refresh_rows()
-        else:
-            await self.__refresh_rows()
-
-    async def __refresh_rows(self) -> None:
-        self.rows.clear()
-        for file in self.open_files:
-            fd = str(file.fd)
-            # TODO: spaces are breaking how the filepath is rendered. The spaces exist, but do not render correctly.
-            # NOTE: Explicitly converting to `rich.text.Text(file_path)` before passing to `add_row()` does not fix the problem
-            # Consider filing a bug report on github in the future.
-            fp = file.path.replace(" ", "_")
-            fs = file.filesize
-            self.add_row(fd, fp, fs)
-        logger.log("".join([file.path for file in self.open_files]))
-
-    async def _refresh_columns(self, with_lock=True) -> None:
-        """
-        Refresh the columns of the widget
-
-        params:
-            with_lock: bool = True
-                if True, the method will acquire the lock before proceeding
-        """
-        if with_lock:
-            async with self.__lock:
-                await self.__refresh_columns()
-        else:
-            await self.__refresh_columns()
-
-    async def __refresh_columns(self) -> None:
-        """
-        function to refresh the columns of the widget
-
-        Call this directly if you cannot await the result for some reason
+        if not self.columns:
+            return  # not laid out yet - rows need columns to land in
+        # collect off the event loop - one stat per file adds up fast
+        files = await asyncio.to_thread(self._collect_files)
+        # batch_update() coalesces the per-row layout invalidations into one
+        with self.app.batch_update():
+            for file in files:
+                # fd stays an int - DataTable stringifies it at render time
+                fd = file.fd
+                # TODO: spaces are breaking how the filepath is rendered. The spaces exist, but do not render correctly.
+                # NOTE: Explicitly converting to `rich.text.Text(file_path)` before passing to `add_row()` does not fix the problem
+                # Consider filing a bug report on github in the future.
+                fp = file.path.translate(self._SPACE_TRANS)
+                fs = file.filesize
+                self.add_row(fd, fp, fs)
+
+    async def _refresh_columns(self) -> None:
+        """Refresh the columns of the widget
+
+        Widths derive from the widget's own size, which textual keeps current -
+        no tty interrogation. In landscape the widget is already half the
+        terminal wide, so no orientation special-casing is needed either
         """
-        if self.has_size_changed or not self.columns:
-            _, columns = get_terminal_size()
-            fd_width = 5
-            if self.app.should_render_in_landscape_mode:  # pyright: ignore
-                path_width = (columns // 2) - 25
-            else:
-                path_width = columns - 25
-            filesize_width = 10
-            self.columns.clear()
-            self.add_column("FD", width=fd_width)
-            self.add_column("Path", width=path_width)
-            self.add_column("File Size", width=filesize_width)
+        if not (self._columns_stale or not self.columns):
+            return
+        width = self.size.width
+        if width <= 0:
+            return  # not laid out yet - the first resize event rebuilds us
+        fd_width = 5
+        path_width = width - 25
+        filesize_width = 10
+        self.clear(columns=True)
+        self.add_column("FD", width=fd_width)
+        self.add_column("Path", width=path_width)
+        self.add_column("File Size", width=filesize_width)
+        self._columns_stale = False
 
     def on_data_table_row_highlighted(self, event) -> None:
         # RowHighlighted(cursor_row=1, row_key=<textual.widgets._data_table.RowKey object at 0x10874dcd0>
         """Event handler for when a row is highlighted"""
         row = self.get_row(event.row_key)
-        logger.log(f"[!!] OpenFilesListWidget: highlighted row: {row}")
+        if logger.enabled:
+            logger.log(f"[!!] OpenFilesListWidget: highlighted row: {row}")
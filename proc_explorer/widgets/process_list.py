@@ -3,14 +3,44 @@ from textual.widgets import DataTable
 from textual import events
 
 from proc_explorer.logger import logger
-from proc_explorer.util import get_terminal_size
+
+import os
+import sys
 
 import psutil
-import time
 
 import asyncio
-
-from proc_explorer.util import shared_process
+from bisect import bisect_left
+
+_LINUX = sys.platform.startswith("linux")
+
+_PROC_FD = -1
+"""fd on the /proc directory itself, held for the process lifetime.
+
+Opening '<pid>/stat' relative to it (openat) skips re-resolving the /proc
+path component on every read"""
+if _LINUX:
+    try:
+        _PROC_FD = os.open("/proc", os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        _PROC_FD = -1
+
+_PROC_STATES = {
+    "R": psutil.STATUS_RUNNING,
+    "S": psutil.STATUS_SLEEPING,
+    "D": psutil.STATUS_DISK_SLEEP,
+    "T": psutil.STATUS_STOPPED,
+    "t": psutil.STATUS_TRACING_STOP,
+    "Z": psutil.STATUS_ZOMBIE,
+    "X": psutil.STATUS_DEAD,
+    "x": psutil.STATUS_DEAD,
+    "W": psutil.STATUS_WAKING,
+    "I": psutil.STATUS_IDLE,
+    "P": psutil.STATUS_PARKED,
+}
+"""maps the single-letter state from /proc/<pid>/stat to psutil's status strings"""
+
+from proc_explorer.util import ProcessListChanged, shared_process
 
 
 class ProcessesListWidget(DataTable):
@@ -29,34 +59,38 @@ class ProcessesListWidget(DataTable):
     ]
 
     def __init__(self, *args, **kwargs):
-        default_kwargs = {
-            "show_header": True,
-            "cursor_type": "row",
-        }
-        """default kwargs for the widget. These will be merged **kwargs. **kwargs overrides default_kwargs if there is a conflict."""
-        kwargs = {**default_kwargs, **kwargs}
+        # default kwargs for the widget. Caller-provided **kwargs win on conflict.
+        kwargs.setdefault("show_header", True)
+        kwargs.setdefault("cursor_type", "row")
         super().__init__(*args, **kwargs)
 
-        self.__last_timestamp = time.time() - 60
-        """timestamp of the last time the widget was refreshed"""
-        self.__RERENDER_DELAY = 10.0
-        """seconds to wait until re-rendering widget with UI refresh loop"""
-        self.__POLLING_INTERVAL = 0.50
-        """seconds to wait between all polling. Primarily used by UI refresh loop"""
-        self.__lock = asyncio.Lock()
-        """async friendly lock to prevent deadlocks and concurrency issues"""
-        self.__last_terminal_size = get_terminal_size()
-        """Terminal screen size"""
+        self._refreshing = False
+        """Flag set while a refresh is in flight. Only one task ever refreshes,
+        so a plain bool is enough - no lock, no extra await suspension points"""
+        self._columns_stale = True
+        """True when the columns need (re)building - set by resize events"""
         self.loading = True
         """Flag to indicate if the widget is loading. Widget renders a loader when this is True"""
+        self._pids_sorted: list[int] = []
+        """PIDs of the rendered rows in ascending order, used for cursor restore"""
+        self._pid_to_rowkey = {}
+        """maps a PID to the RowKey of the row rendering it"""
+        self._procs: dict[int, tuple[str, str]] = {}
+        """snapshot of the (name, status) rendered for each PID, used to diff refreshes"""
+        self._proc_cache: dict[int, psutil.Process] = {}
+        """psutil.Process objects for rendered PIDs. Constructing one stats /proc,
+        so cache them; entries are evicted when their row is removed"""
 
     async def on_resize(self, event: events.Resize) -> None:
-        """Resize event handler for the widget"""
-        if self.loading or self.__lock.locked():
+        """Resize event handler for the widget
+
+        textual delivers the new size with the event, so there's nothing to
+        poll - just mark the columns stale and re-render
+        """
+        self._columns_stale = True
+        if self._refreshing:
             return
-        if self.has_size_changed:
-            await self._refresh()
-            self.__last_terminal_size = get_terminal_size()
+        await self._refresh()
 
     @property
     def proc(self) -> psutil.Process | None:
@@ -69,7 +103,10 @@ class ProcessesListWidget(DataTable):
         if not row_values:
             return None
         pid = row_values[0]
-        return psutil.Process(pid=pid)
+        proc = self._proc_cache.get(pid)
+        if proc is None:
+            proc = self._proc_cache[pid] = psutil.Process(pid=pid)
+        return proc
 
     def on_data_table_row_highlighted(self, row: int) -> None:
         """Event handler for when a row is highlighted"""
@@ -77,7 +114,8 @@ class ProcessesListWidget(DataTable):
         if pid is not None:
             shared_process.pid = pid
 
-        logger.log(f"highlighted row: {row} | pid: {shared_process.pid})")
+        if logger.enabled:
+            logger.log(f"highlighted row: {row} | pid: {shared_process.pid})")
 
     @property
     def row_values(self) -> tuple[int, str, str] | None:
@@ -89,7 +127,8 @@ class ProcessesListWidget(DataTable):
         if not self.rows:
             return None
         pid, name, status = self.get_row_at(self.cursor_row)
-        logger.log(f"pid: {pid}, name: {name}, status: {status}")
+        if logger.enabled:
+            logger.log(f"pid: {pid}, name: {name}, status: {status}")
         if pid is None or name is None or status is None:
             return None
         pid = int(pid)
@@ -133,12 +172,6 @@ class ProcessesListWidget(DataTable):
         status = row_values[2]
         return status
 
-    @property
-    def has_size_changed(self) -> bool:
-        """Check if the terminal size has changed"""
-        lines, columns = get_terminal_size()
-        return not self.__last_terminal_size == (lines, columns)
-
     def on_mount(self) -> None:
         """
         Mount event handler for the widget
@@ -148,137 +181,187 @@ class ProcessesListWidget(DataTable):
 
         the widget is mounted when it is added to the DOM of the app
         """
-        self.run_worker(
-            self._refresh_loop, group="process_list", name="process_list", thread=True
-        )
+        # runs on the app's event loop - the syscall-heavy collection is pushed
+        # to a thread by the refresh itself via asyncio.to_thread
+        self.run_worker(self._refresh_loop, group="process_list", name="process_list")
 
-    async def _refresh(self, remember_cursor_position=True, with_lock=True) -> None:
+    async def _refresh(self) -> None:
         """
         Manually refresh the widget aka re-render the widget
 
         This also recalculates anything the UI depends on in order to properly render
-        """
-        self.loading = True
-        old_pid = self.proc_pid
-        self.clear()
-        await self._refresh_columns(with_lock=with_lock)
-        await self._refresh_rows(with_lock=with_lock)
-        if remember_cursor_position and old_pid is not None:
-            self._move_cursor_to_closet_pid(old_pid)
-        else:
-            logger.log("Not moving cursor to prev position")
-            logger.log(f"old_pid: {old_pid}")
-        self.loading = False
-
-    async def _refresh_columns(self, with_lock=True) -> None:
-        """
-        Refresh the columns of the widget
-
-        params:
-            with_lock: bool = True
-                if True, the method will acquire the lock before proceeding
-        """
-        if with_lock:
-            async with self.__lock:
-                await self.__refresh_columns()
-        else:
-            await self.__refresh_columns()
 
-    async def __refresh_columns(self) -> None:
+        The diff-based row refresh never moves rows that are still alive, so the
+        cursor stays put on its own. The only case needing intervention is the
+        process under the cursor exiting, handled by _focus_closest_pid
         """
-        function to refresh the columns of the widget
-
-        Call this directly if you cannot await the result for some reason
+        if self._refreshing:
+            return
+        self._refreshing = True
+        try:
+            if not self.rows:
+                self.loading = True
+            old_pid = self.proc_pid
+            # columns are only rebuilt when a resize marked them stale - the
+            # periodic refresh skips straight to diffing rows
+            rebuilt = self._columns_stale
+            if rebuilt:
+                await self._refresh_columns()
+            await self._refresh_rows()
+            if old_pid is not None:
+                if old_pid not in self._pid_to_rowkey:
+                    self._focus_closest_pid(old_pid)
+                elif rebuilt:
+                    # the rebuild wiped the rows, which reset the cursor
+                    row = self.get_row_index(self._pid_to_rowkey[old_pid])
+                    self.move_cursor(row=row, column=0)
+            self.loading = False
+        finally:
+            self._refreshing = False
+
+    async def _refresh_columns(self) -> None:
+        """Refresh the columns of the widget
+
+        Widths derive from the widget's own size, which textual keeps current -
+        no tty interrogation. In landscape the widget is already half the
+        terminal wide, so no orientation special-casing is needed either
         """
-        if self.has_size_changed or not self.columns:
-            _, columns = get_terminal_size()
-            pid_width = 8
-            if self.app.should_render_in_landscape_mode:  # pyright: ignore
-                name_width = (columns // 2) - 28
-            else:
-                name_width = columns - 28
-            status_width = 10
-            self.columns.clear()
-            self.add_column("PID", width=pid_width)
-            self.add_column("Name", width=name_width)
-            self.add_column("Status", width=status_width)
-
-    async def _refresh_rows(self, with_lock=True) -> None:
+        if not (self._columns_stale or not self.columns):
+            return
+        width = self.size.width
+        if width <= 0:
+            return  # not laid out yet - the first resize event rebuilds us
+        pid_width = 8
+        name_width = width - 28
+        status_width = 10
+        # rebuilding columns invalidates every row, so wipe the diff state
+        # and let the next row refresh repopulate from scratch
+        self.clear(columns=True)
+        self._pid_to_rowkey.clear()
+        self._procs = {}
+        self._proc_cache.clear()
+        self._pid_col_key = self.add_column("PID", width=pid_width)
+        self._name_col_key = self.add_column("Name", width=name_width)
+        self._status_col_key = self.add_column("Status", width=status_width)
+        self._columns_stale = False
+
+    async def _refresh_rows(self) -> None:
         """Refresh the rows of the widget"""
-        if with_lock:
-            async with self.__lock:
-                await self.__refresh_rows()
-        else:
-            await self.__refresh_rows()
-
-    async def __refresh_rows(self) -> None:
+        if not self.columns:
+            return  # not laid out yet - rows need columns to land in
+        logger.log("Updating processes...")
+        # the /proc walk is pure syscalls - run it off the event loop so input
+        # stays responsive while it runs. Only the widget mutations below have
+        # to happen on the loop.
+        new_procs = await asyncio.to_thread(self._collect_procs)
+
+        # only touch rows whose process appeared, exited, or changed - on a
+        # typical interval that is a handful of rows, not the whole table.
+        # batch_update() coalesces the per-row layout invalidations into one.
+        with self.app.batch_update():
+            for pid in list(self._pid_to_rowkey.keys() - new_procs.keys()):
+                self.remove_row(self._pid_to_rowkey.pop(pid))
+                self._proc_cache.pop(pid, None)
+            for pid in sorted(new_procs):
+                name, status = new_procs[pid]
+                row_key = self._pid_to_rowkey.get(pid)
+                if row_key is None:
+                    # the pid goes in as an int - DataTable stringifies it at
+                    # render time, so there's no str() per row here
+                    self._pid_to_rowkey[pid] = self.add_row(pid, name, status)
+                elif (name, status) != self._procs[pid]:
+                    old_name, old_status = self._procs[pid]
+                    if name != old_name:
+                        self.update_cell(row_key, self._name_col_key, name)
+                    if status != old_status:
+                        self.update_cell(row_key, self._status_col_key, status)
+
+        self._procs = new_procs
+        self._pids_sorted = sorted(new_procs)
+
+    def _collect_procs(self) -> dict[int, tuple[str, str]]:
+        """Walk the process table and return {pid: (name, status)}
+
+        Synchronous on purpose - this is the syscall-heavy half of the row
+        refresh and is run in a thread via asyncio.to_thread()
+
+        On Linux this reads /proc/<pid>/stat directly - one open+read per
+        process covers all three fields we display, without constructing a
+        psutil.Process per PID. Other platforms go through psutil.
         """
-        function to refresh the rows of the widget
+        if _LINUX and _PROC_FD >= 0:
+            return self._collect_procs_procfs()
+        return self._collect_procs_psutil()
 
-        call this directly if you cannot await the result for some reason
+    def _collect_procs_procfs(self) -> dict[int, tuple[str, str]]:
+        """Linux fast path: parse name + state straight out of /proc/<pid>/stat
+
+        Scans /proc itself rather than asking psutil for the pid list - the
+        numeric directory entries *are* the pid list
         """
-        logger.log("Updating processes...")
-        self.rows.clear()
-        for proc in psutil.process_iter():
+        procs: dict[int, tuple[str, str]] = {}
+        for entry in os.scandir("/proc"):
+            if not entry.name.isdigit():
+                continue
+            pid = int(entry.name)
             try:
-                pid = proc.pid
-                name = proc.name()
-                status = proc.status()
-                self.add_row(str(pid), name, status)
-            except psutil.NoSuchProcess:
-                pass
-        self.__last_timestamp = time.time()
-
-    async def _refresh_loop(self) -> None:
-        """main event loop for refreshing the widgets UI in the background"""
-        while self.app._running:
-            if self.__lock.locked():
-                await asyncio.sleep(self.__POLLING_INTERVAL)
+                # openat relative to the held /proc fd - no /proc path lookup
+                fd = os.open(f"{entry.name}/stat", os.O_RDONLY, dir_fd=_PROC_FD)
+            except OSError:  # process exited mid-walk
                 continue
-
-            if time.time() - self.__last_timestamp < self.__RERENDER_DELAY:
-                await asyncio.sleep(self.__POLLING_INTERVAL)
+            try:
+                buf = os.read(fd, 2048)  # stat is a few hundred bytes at most
+            except OSError:
                 continue
+            finally:
+                os.close(fd)
+            # comm is wrapped in parens and may itself contain parens/spaces,
+            # so find it from both ends. The state letter follows the ") "
+            start = buf.index(b"(") + 1
+            end = buf.rindex(b")")
+            name = buf[start:end].decode("utf-8", "replace")
+            state = chr(buf[end + 2])
+            procs[pid] = (name, _PROC_STATES.get(state, state))
+        return procs
+
+    def _collect_procs_psutil(self) -> dict[int, tuple[str, str]]:
+        """Portable path: batched attribute reads through psutil"""
+        procs: dict[int, tuple[str, str]] = {}
+        for proc in psutil.process_iter(["pid", "name", "status"], ad_value=""):
+            info = proc.info
+            procs[info["pid"]] = (info["name"], info["status"])
+        return procs
 
-            await self._refresh()
-            await asyncio.sleep(0.10)
+    async def _refresh_loop(self) -> None:
+        """main event loop for refreshing the widgets UI in the background
 
-    def __distance_from_pid(self, pid) -> int:
+        No timer of its own - the app's refresh bus decides the cadence
         """
-        gives us an idea of how far away we are from a specific PID
+        queue = self.app.refresh_bus.subscribe()  # pyright: ignore
+        await self._refresh()  # initial population; the bus drives everything after
+        while self.app._running:
+            event = await queue.get()
+            if isinstance(event, ProcessListChanged):
+                await self._refresh()
 
-        used exclusively for locating the PID that most closely resembles the last PID we were focused on
+    def _focus_closest_pid(self, pid: int) -> None:
         """
-        distance = self.proc_pid - pid
-        if distance < 0:
-            distance *= -1
-        return distance
+        Focus the row whose PID is numerically closest to the given (now gone) PID
 
-    def _move_cursor_to_closet_pid(self, pid: int) -> None:
-        """
-        Find the PID closest to the PID we were last looking at, and focus that PID
+        This is a binary search over self._pids_sorted followed by a single
+        move_cursor() call
         """
-        logger.log(f"Moving cursor to PID: {pid}")
-        logger.log(f"Current PID: {self.proc_pid}")
-        while self.proc_pid != pid:
-            logger.log(f"move_cursor iteration")
-            distance_from_pid = self.__distance_from_pid(pid)
-            logger.log(f"distance: {distance_from_pid}")
-
-            if self.proc_pid and self.proc_pid > pid:
-                cords = self.cursor_coordinate.up()
-                logger.log("moving up")
-            else:
-                cords = self.cursor_coordinate.down()
-                logger.log("moving down")
-
-            logger.log(f"cords: {cords}")
-            self.move_cursor(row=cords.row, column=cords.column)
-            logger.log(f"moved cursor to: {self.cursor_coordinate}")
-
-            new_distance_from_pid = self.__distance_from_pid(pid)
-            logger.log(f"new distance: {new_distance_from_pid}")
-
-            if distance_from_pid <= new_distance_from_pid:
-                logger.log("did not get closer. breaking out of loop")
-                break
+        if logger.enabled:
+            logger.log(f"Moving cursor to PID: {pid}")
+        if not self._pids_sorted:
+            return
+        idx = bisect_left(self._pids_sorted, pid)
+        if idx >= len(self._pids_sorted):
+            idx = len(self._pids_sorted) - 1
+        elif idx > 0:
+            # bisect gives us the first PID >= pid. The previous PID may be closer.
+            if pid - self._pids_sorted[idx - 1] < self._pids_sorted[idx] - pid:
+                idx -= 1
+        closest_pid = self._pids_sorted[idx]
+        row = self.get_row_index(self._pid_to_rowkey[closest_pid])
+        self.move_cursor(row=row, column=0)